@@ -5,6 +5,7 @@ This script provides a simple way to start the server with proper error handling
 and helpful messages.
 """
 
+import asyncio
 import sys
 import os
 
@@ -13,49 +14,53 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 if __name__ == "__main__":
     try:
-        from src.server import mcp
+        from src.server import configure_logging, get_mcp, run_http
         from src.config import get_config
         
+        # Install log handlers first so configuration loading messages are shown
+        configure_logging()
         config = get_config()
+        configure_logging(config.server.log_level)
+        mcp = get_mcp(config)
         
-        print("=" * 60)
-        print(f"Starting {config.server.name} v{config.server.version}")
-        print("=" * 60)
-        print()
-        
-        # Run the server
-        mcp.run(
-            transport="http",
-            host=config.server.host,
-            port=config.server.port
+        sys.stdout.write(
+            "=" * 60 + "\n"
+            f"Starting {config.server.name} v{config.server.version}\n"
+            + "=" * 60 + "\n\n"
         )
         
+        # Run the server; pooled connections are closed when it stops
+        asyncio.run(run_http(mcp, config.server.host, config.server.port))
+        
     except ImportError as e:
-        print("❌ Error: Missing dependencies")
-        print()
-        print("Please install the required dependencies:")
-        print("  pip install -r requirements.txt")
-        print()
-        print(f"Details: {e}")
+        sys.stdout.write(
+            "❌ Error: Missing dependencies\n"
+            "\n"
+            "Please install the required dependencies:\n"
+            "  pip install -r requirements.txt\n"
+            "\n"
+            f"Details: {e}\n"
+        )
         sys.exit(1)
         
     except ValueError as e:
-        print("❌ Error: Configuration problem")
-        print()
-        print("Please check your .env file and ensure all required")
-        print("environment variables are set correctly.")
-        print()
-        print("Required variables:")
-        print("  - FASTMCP_SERVER_AUTH_AZURE_CLIENT_ID")
-        print("  - FASTMCP_SERVER_AUTH_AZURE_CLIENT_SECRET")
-        print("  - FASTMCP_SERVER_AUTH_AZURE_TENANT_ID")
-        print()
-        print(f"Details: {e}")
+        sys.stdout.write(
+            "❌ Error: Configuration problem\n"
+            "\n"
+            "Please check your .env file and ensure all required\n"
+            "environment variables are set correctly.\n"
+            "\n"
+            "Required variables:\n"
+            "  - FASTMCP_SERVER_AUTH_AZURE_CLIENT_ID\n"
+            "  - FASTMCP_SERVER_AUTH_AZURE_CLIENT_SECRET\n"
+            "  - FASTMCP_SERVER_AUTH_AZURE_TENANT_ID\n"
+            "\n"
+            f"Details: {e}\n"
+        )
         sys.exit(1)
         
     except KeyboardInterrupt:
-        print()
-        print("Server stopped by user")
+        sys.stdout.write("\nServer stopped by user\n")
         sys.exit(0)
         
     except Exception as e:
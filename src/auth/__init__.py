@@ -1,6 +1,14 @@
-"""Authentication providers for Newsroom MCP server."""
+"""Authentication providers for Newsroom MCP server.
 
-from src.auth.patched_azure_provider import PatchedAzureProvider
+Providers are loaded on first attribute access so that importing this package
+does not pull in FastMCP's auth stack until a provider is actually used.
+"""
 
-__all__ = ["PatchedAzureProvider"]
+__all__ = ["PatchedAzureProvider", "PooledAzureTokenVerifier"]
 
+
+def __getattr__(name):
+    if name in __all__:
+        from src.auth import patched_azure_provider
+        return getattr(patched_azure_provider, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
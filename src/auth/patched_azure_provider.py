@@ -7,10 +7,251 @@ The standard AzureProvider adds a 'resource' parameter to the OAuth authorizatio
 but Azure AD v2.0 doesn't support this parameter and returns an error.
 
 This patched provider removes the 'resource' parameter to ensure compatibility with
-Azure AD v2.0 endpoints.
+Azure AD v2.0 endpoints. It also verifies tokens through a pooled HTTP client so
+Microsoft Graph connections are reused across requests.
 """
 
-from fastmcp.server.auth.providers.azure import AzureProvider
+import asyncio
+import base64
+import functools
+import importlib.util
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from fastmcp.server.auth import AccessToken
+from fastmcp.server.auth.providers.azure import AzureProvider, AzureTokenVerifier
+
+logger = logging.getLogger(__name__)
+
+# Microsoft Graph endpoint used to validate Azure access tokens
+GRAPH_ME_URL = "https://graph.microsoft.com/v1.0/me"
+
+# HTTP/2 lets concurrent Graph calls share one connection; httpx needs the
+# optional 'h2' package for it (pip install "httpx[http2]")
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Default for how long a successful verification is reused for the same token,
+# and how many tokens are remembered at most
+DEFAULT_TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAX_SIZE = 1024
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the 'exp' claim from a JWT without verifying it.
+    
+    Only used to stop cached verifications outliving the token itself; the
+    token's validity is still established by Microsoft Graph.
+    
+    Args:
+        token: The bearer token
+        
+    Returns:
+        Expiry as a Unix timestamp, or None if the token is not a readable JWT
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+class PooledAzureTokenVerifier(AzureTokenVerifier):
+    """Azure token verifier that reuses a single HTTP connection pool.
+    
+    FastMCP's AzureTokenVerifier validates each token by calling Microsoft
+    Graph, but opens a new httpx.AsyncClient for every verify_token call. That
+    means a fresh TCP connection and TLS handshake on every authenticated
+    request. This verifier keeps one client with keep-alive connections for
+    its whole lifetime.
+    
+    Successful verifications are also cached for token_cache_ttl_seconds (or
+    until the token expires, if sooner), so repeat requests with the same
+    token skip the Graph round-trip. Failed verifications are never cached.
+    
+    Note that this delays revocation: a token that Microsoft Graph would now
+    reject (revoked, user disabled) can still be accepted for up to
+    token_cache_ttl_seconds (5 minutes by default, set through
+    FASTMCP_SERVER_AUTH_AZURE_TOKEN_CACHE_TTL_SECONDS) after its last
+    successful check. A TTL of 0 disables the cache.
+    """
+    
+    def __init__(
+        self,
+        *,
+        required_scopes: Optional[List[str]] = None,
+        timeout_seconds: int = 10,
+        token_cache_ttl_seconds: int = DEFAULT_TOKEN_CACHE_TTL_SECONDS,
+    ):
+        """Initialize the pooled Azure token verifier.
+        
+        Args:
+            required_scopes: Required OAuth scopes
+            timeout_seconds: HTTP request timeout for Microsoft Graph calls
+            token_cache_ttl_seconds: How long a successful verification is
+                reused; 0 disables the cache
+        """
+        super().__init__(required_scopes=required_scopes, timeout_seconds=timeout_seconds)
+        self.token_cache_ttl_seconds = token_cache_ttl_seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # token -> (monotonic deadline, verified access token)
+        self._token_cache: Dict[str, Tuple[float, AccessToken]] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+        
+        A new client is also created when called from a different event loop,
+        since pooled connections cannot be shared across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._release_client()
+        if self._client is None or self._client.is_closed:
+            self._client_loop = loop
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+    
+    def _release_client(self) -> None:
+        """Drop the client, closing it on its own event loop if that loop still runs.
+        
+        A client whose loop has already finished can no longer be closed
+        gracefully; its sockets are released when it is garbage collected. The
+        server entry points call aclose() on shutdown, so this only happens
+        when a caller skips it.
+        """
+        client, client_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is not None and not client.is_closed and client_loop is not None and client_loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+        else:
+            self._release_client()
+    
+    async def verify_token(self, token: str) -> Optional[AccessToken]:
+        """Verify an Azure OAuth token, reusing a recent successful result.
+        
+        Args:
+            token: The bearer token to verify
+            
+        Returns:
+            AccessToken with the user's claims, or None if the token is invalid
+        """
+        if self.token_cache_ttl_seconds <= 0:
+            return await self._verify_with_graph(token)
+        
+        now = time.monotonic()
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            if cached[0] > now:
+                return cached[1]
+            del self._token_cache[token]
+        
+        access_token = await self._verify_with_graph(token)
+        if access_token is not None:
+            self._cache_token(token, access_token, now)
+        return access_token
+    
+    def _cache_token(self, token: str, access_token: AccessToken, now: float) -> None:
+        """Remember a successful verification until its TTL or token expiry."""
+        ttl = self.token_cache_ttl_seconds
+        expires_at = _token_expiry(token)
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl <= 0:
+            return
+        
+        cache = self._token_cache
+        if len(cache) >= TOKEN_CACHE_MAX_SIZE:
+            for key in [key for key, (deadline, _) in cache.items() if deadline <= now]:
+                del cache[key]
+            while len(cache) >= TOKEN_CACHE_MAX_SIZE:
+                # Drop the oldest entry (dicts preserve insertion order)
+                del cache[next(iter(cache))]
+        cache[token] = (now + ttl, access_token)
+    
+    async def _verify_with_graph(self, token: str) -> Optional[AccessToken]:
+        """Verify an Azure OAuth token by calling Microsoft Graph API.
+        
+        Args:
+            token: The bearer token to verify
+            
+        Returns:
+            AccessToken with the user's claims, or None if the token is invalid
+        """
+        try:
+            response = await self._get_client().get(
+                GRAPH_ME_URL,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "User-Agent": "FastMCP-Azure-OAuth",
+                },
+            )
+            
+            if response.status_code != 200:
+                logger.debug(
+                    "Azure token verification failed: %d - %s",
+                    response.status_code,
+                    response.text[:200],
+                )
+                return None
+            
+            user_data = response.json()
+            
+            return AccessToken(
+                token=token,
+                client_id=str(user_data.get("id", "unknown")),
+                scopes=self.required_scopes or [],
+                expires_at=None,
+                claims={
+                    "sub": user_data.get("id"),
+                    "email": user_data.get("mail") or user_data.get("userPrincipalName"),
+                    "name": user_data.get("displayName"),
+                    "given_name": user_data.get("givenName"),
+                    "family_name": user_data.get("surname"),
+                    "job_title": user_data.get("jobTitle"),
+                    "office_location": user_data.get("officeLocation"),
+                },
+            )
+            
+        except httpx.RequestError as e:
+            logger.debug("Failed to verify Azure token: %s", e)
+            return None
+        except Exception as e:
+            logger.debug("Azure token verification error: %s", e)
+            return None
+
+
+@functools.lru_cache(maxsize=8)
+def _pooled_token_verifier(
+    required_scopes: Tuple[str, ...],
+    timeout_seconds: int,
+    token_cache_ttl_seconds: int,
+) -> PooledAzureTokenVerifier:
+    """Return a shared token verifier for the given settings.
+    
+    Providers rebuilt with the same settings (tests, config reloads) reuse one
+    verifier and therefore one connection pool to Microsoft Graph.
+    """
+    return PooledAzureTokenVerifier(
+        required_scopes=list(required_scopes),
+        timeout_seconds=timeout_seconds,
+        token_cache_ttl_seconds=token_cache_ttl_seconds,
+    )
 
 
 class PatchedAzureProvider(AzureProvider):
@@ -28,6 +269,9 @@ class PatchedAzureProvider(AzureProvider):
     1. Overrides _get_resource_url() to return None (forces v2.0 behavior)
     2. Strips the 'resource' parameter from authorization requests
     
+    It also swaps the default token verifier for PooledAzureTokenVerifier so
+    Microsoft Graph connections are kept alive between requests.
+    
     Usage:
         auth_provider = PatchedAzureProvider(
             client_id="your-client-id",
@@ -44,6 +288,38 @@ class PatchedAzureProvider(AzureProvider):
         - Azure AD v2.0 Docs: https://learn.microsoft.com/en-us/azure/active-directory/develop/v2-oauth2-auth-code-flow
     """
     
+    def __init__(
+        self,
+        *,
+        token_cache_ttl_seconds: int = DEFAULT_TOKEN_CACHE_TTL_SECONDS,
+        **kwargs,
+    ):
+        """Initialize the provider and install the pooled token verifier.
+        
+        Args:
+            token_cache_ttl_seconds: How long a successful token verification
+                is reused; 0 disables the cache
+            **kwargs: Keyword arguments passed to AzureProvider
+        """
+        super().__init__(**kwargs)
+        
+        verifier = self._token_validator
+        if type(verifier) is AzureTokenVerifier:
+            self._token_validator = _pooled_token_verifier(
+                tuple(verifier.required_scopes or ()),
+                verifier.timeout_seconds,
+                token_cache_ttl_seconds,
+            )
+    
+    async def aclose(self) -> None:
+        """Close the token verifier's pooled HTTP connections.
+        
+        Call this when the server shuts down, from the event loop it ran on.
+        """
+        verifier = self._token_validator
+        if isinstance(verifier, PooledAzureTokenVerifier):
+            await verifier.aclose()
+    
     def _get_resource_url(self, mcp_path: str) -> None:
         """Override to return None and force Azure AD v2.0 behavior.
         
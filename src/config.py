@@ -6,17 +6,31 @@ centralized configuration for the MCP server and Azure OAuth authentication.
 
 import os
 import logging
+import re
+import threading
 from dataclasses import dataclass, field
 from typing import List, Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Scopes may be separated by commas and/or whitespace
+_SCOPE_SPLIT = re.compile(r"[,\s]+")
+
+# (field name, environment variable, default) for each Azure OAuth setting.
+# A default of None marks the variable as required.
+_AZURE_ENV_FIELDS = (
+    ("client_id", "FASTMCP_SERVER_AUTH_AZURE_CLIENT_ID", None),
+    ("client_secret", "FASTMCP_SERVER_AUTH_AZURE_CLIENT_SECRET", None),
+    ("tenant_id", "FASTMCP_SERVER_AUTH_AZURE_TENANT_ID", None),
+    ("base_url", "FASTMCP_SERVER_AUTH_AZURE_BASE_URL", "http://localhost:8000"),
+    ("redirect_path", "FASTMCP_SERVER_AUTH_AZURE_REDIRECT_PATH", "/auth/callback"),
+    ("required_scopes", "FASTMCP_SERVER_AUTH_AZURE_REQUIRED_SCOPES", "User.Read,email,openid,profile"),
+    ("timeout_seconds", "FASTMCP_SERVER_AUTH_AZURE_TIMEOUT_SECONDS", "10"),
+    ("token_cache_ttl_seconds", "FASTMCP_SERVER_AUTH_AZURE_TOKEN_CACHE_TTL_SECONDS", "300"),
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AzureOAuthConfig:
     """Azure OAuth configuration settings.
     
@@ -31,29 +45,28 @@ class AzureOAuthConfig:
     redirect_path: str = "/auth/callback"
     required_scopes: List[str] = field(default_factory=lambda: ["User.Read", "email", "openid", "profile"])
     timeout_seconds: int = 10
+    token_cache_ttl_seconds: int = 300
     
     @classmethod
     def from_env(cls) -> "AzureOAuthConfig":
         """Load Azure OAuth configuration from environment variables.
         
+        All variables are read in a single pass over _AZURE_ENV_FIELDS.
+        
         Returns:
             AzureOAuthConfig: Configuration instance with values from environment.
             
         Raises:
             ValueError: If required environment variables are missing.
         """
-        client_id = os.getenv("FASTMCP_SERVER_AUTH_AZURE_CLIENT_ID")
-        client_secret = os.getenv("FASTMCP_SERVER_AUTH_AZURE_CLIENT_SECRET")
-        tenant_id = os.getenv("FASTMCP_SERVER_AUTH_AZURE_TENANT_ID")
-        
-        # Validate required fields
+        getenv = os.getenv
+        values = {}
         missing_vars = []
-        if not client_id:
-            missing_vars.append("FASTMCP_SERVER_AUTH_AZURE_CLIENT_ID")
-        if not client_secret:
-            missing_vars.append("FASTMCP_SERVER_AUTH_AZURE_CLIENT_SECRET")
-        if not tenant_id:
-            missing_vars.append("FASTMCP_SERVER_AUTH_AZURE_TENANT_ID")
+        for name, env_var, default in _AZURE_ENV_FIELDS:
+            value = getenv(env_var, default)
+            if default is None and not value:
+                missing_vars.append(env_var)
+            values[name] = value
             
         if missing_vars:
             raise ValueError(
@@ -61,33 +74,32 @@ class AzureOAuthConfig:
                 "Please check your .env file."
             )
         
-        # Load optional fields with defaults
-        base_url = os.getenv("FASTMCP_SERVER_AUTH_AZURE_BASE_URL", "http://localhost:8000")
-        redirect_path = os.getenv("FASTMCP_SERVER_AUTH_AZURE_REDIRECT_PATH", "/auth/callback")
+        # Parse scopes (comma- or space-separated string to list)
+        values["required_scopes"] = [
+            scope for scope in _SCOPE_SPLIT.split(values["required_scopes"].strip()) if scope
+        ]
         
-        # Parse scopes (comma-separated string to list)
-        scopes_str = os.getenv("FASTMCP_SERVER_AUTH_AZURE_REQUIRED_SCOPES", "User.Read,email,openid,profile")
-        required_scopes = [scope.strip() for scope in scopes_str.split(",") if scope.strip()]
-
         # Parse timeout
-        timeout_str = os.getenv("FASTMCP_SERVER_AUTH_AZURE_TIMEOUT_SECONDS", "10")
+        timeout_str = values["timeout_seconds"]
         try:
-            timeout_seconds = int(timeout_str)
+            values["timeout_seconds"] = int(timeout_str)
         except ValueError:
             logger.warning(
-                f"Invalid timeout value '{timeout_str}', using default 10 seconds"
+                "Invalid timeout value '%s', using default 10 seconds", timeout_str
             )
-            timeout_seconds = 10
+            values["timeout_seconds"] = 10
         
-        return cls(
-            client_id=client_id,
-            client_secret=client_secret,
-            tenant_id=tenant_id,
-            base_url=base_url,
-            redirect_path=redirect_path,
-            required_scopes=required_scopes,
-            timeout_seconds=timeout_seconds,
-        )
+        # Parse token cache TTL (0 disables the cache)
+        ttl_str = values["token_cache_ttl_seconds"]
+        try:
+            values["token_cache_ttl_seconds"] = int(ttl_str)
+        except ValueError:
+            logger.warning(
+                "Invalid token cache TTL value '%s', using default 300 seconds", ttl_str
+            )
+            values["token_cache_ttl_seconds"] = 300
+        
+        return cls(**values)
     
     @property
     def redirect_uri(self) -> str:
@@ -98,9 +110,14 @@ class AzureOAuthConfig:
         """
         return f"{self.base_url.rstrip('/')}{self.redirect_path}"
     
+    def __post_init__(self) -> None:
+        self.validate()
+    
     def validate(self) -> None:
         """Validate configuration values.
         
+        Called automatically when an instance is constructed.
+        
         Raises:
             ValueError: If configuration values are invalid.
         """
@@ -122,11 +139,14 @@ class AzureOAuthConfig:
         if self.timeout_seconds < 1 or self.timeout_seconds > 300:
             raise ValueError("timeout_seconds must be between 1 and 300")
         
+        if self.token_cache_ttl_seconds < 0:
+            raise ValueError("token_cache_ttl_seconds must be 0 or greater")
+        
         if not self.required_scopes:
             raise ValueError("At least one OAuth scope is required")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerConfig:
     """MCP server configuration settings."""
     
@@ -152,7 +172,7 @@ class ServerConfig:
         try:
             port = int(port_str)
         except ValueError:
-            logger.warning(f"Invalid port value '{port_str}', using default 8000")
+            logger.warning("Invalid port value '%s', using default 8000", port_str)
             port = 8000
         
         log_level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
@@ -165,9 +185,14 @@ class ServerConfig:
             log_level=log_level,
         )
     
+    def __post_init__(self) -> None:
+        self.validate()
+    
     def validate(self) -> None:
         """Validate configuration values.
         
+        Called automatically when an instance is constructed.
+        
         Raises:
             ValueError: If configuration values are invalid.
         """
@@ -179,7 +204,7 @@ class ServerConfig:
             raise ValueError(f"log_level must be one of {valid_log_levels}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration container for the Newsroom MCP server."""
     
@@ -199,40 +224,41 @@ class Config:
         logger.info("Loading configuration from environment variables...")
         
         try:
+            # Both configs validate themselves on construction
             server_config = ServerConfig.from_env()
             azure_config = AzureOAuthConfig.from_env()
             
-            # Validate configurations
-            server_config.validate()
-            azure_config.validate()
-            
             config = cls(server=server_config, azure_oauth=azure_config)
             
             logger.info("Configuration loaded successfully")
-            logger.debug(f"Server: {server_config.name} v{server_config.version}")
-            logger.debug(f"Host: {server_config.host}:{server_config.port}")
-            logger.debug(f"Azure Tenant: {azure_config.tenant_id}")
-            logger.debug(f"Redirect URI: {azure_config.redirect_uri}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Server: %s v%s", server_config.name, server_config.version)
+                logger.debug("Host: %s:%s", server_config.host, server_config.port)
+                logger.debug("Azure Tenant: %s", azure_config.tenant_id)
+                logger.debug("Redirect URI: %s", azure_config.redirect_uri)
             
             return config
             
         except ValueError as e:
-            logger.error(f"Configuration error: {e}")
+            logger.error("Configuration error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error loading configuration: {e}")
+            logger.error("Unexpected error loading configuration: %s", e)
             raise
 
 
 # Global configuration instance (lazy-loaded)
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     """Get the global configuration instance.
     
-    This function provides lazy loading of configuration. The configuration
-    is loaded once on first access and cached for subsequent calls.
+    This function provides lazy loading of configuration. The .env file is
+    read and the configuration is loaded once on first access, then cached
+    for subsequent calls. Only the first load takes a lock; concurrent
+    first callers wait for it rather than loading a second copy.
     
     Returns:
         Config: The global configuration instance.
@@ -241,9 +267,18 @@ def get_config() -> Config:
         ValueError: If configuration is invalid or required values are missing.
     """
     global _config
-    if _config is None:
-        _config = Config.load()
-    return _config
+    config = _config
+    if config is not None:
+        return config
+    
+    with _config_lock:
+        if _config is None:
+            from dotenv import load_dotenv
+            
+            # Load environment variables from .env file
+            load_dotenv()
+            _config = Config.load()
+        return _config
 
 
 def reload_config() -> Config:
@@ -255,8 +290,11 @@ def reload_config() -> Config:
     Returns:
         Config: The newly loaded configuration instance.
     """
+    from dotenv import load_dotenv
+    
     global _config
-    load_dotenv(override=True)  # Reload .env file
-    _config = Config.load()
-    return _config
+    with _config_lock:
+        load_dotenv(override=True)  # Reload .env file
+        _config = Config.load()
+        return _config
 
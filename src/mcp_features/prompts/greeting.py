@@ -4,6 +4,13 @@ This module provides a reusable prompt template for generating personalized
 greetings with different styles.
 """
 
+# Prompt templates keyed by style; unknown styles fall back to casual
+_FORMAL_TEMPLATE = """Generate a formal greeting for {name}.
+The greeting should be professional and respectful."""
+_CASUAL_TEMPLATE = """Generate a casual greeting for {name}.
+The greeting should be friendly and warm."""
+_TEMPLATES = {"formal": _FORMAL_TEMPLATE}
+
 
 def register_prompts(mcp):
     """Register all prompts from this module with the MCP server.
@@ -39,10 +46,6 @@ def register_prompts(mcp):
             Output: "Generate a casual greeting for Bob.
                      The greeting should be friendly and warm."
         """
-        if style.lower() == "formal":
-            return f"""Generate a formal greeting for {name}.
-The greeting should be professional and respectful."""
-        else:
-            return f"""Generate a casual greeting for {name}.
-The greeting should be friendly and warm."""
+        template = _TEMPLATES.get(style.casefold(), _CASUAL_TEMPLATE)
+        return template.format(name=name)
 
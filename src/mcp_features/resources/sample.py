@@ -4,19 +4,59 @@ This module provides a simple example resource that returns static JSON data,
 demonstrating how to expose data and content for AI context using FastMCP.
 """
 
-from datetime import datetime
-from typing import Dict, Any
+import time
+from typing import Any
 
+# Static parts of the sample payload, built once and shared by every request
+_SAMPLE_MESSAGE = "This is sample data from an MCP resource"
+_SAMPLE_DATA: dict[str, Any] = {
+    "id": 1,
+    "name": "Sample Resource",
+    "type": "demonstration",
+    "features": [
+        "Static data exposure",
+        "JSON serialization",
+        "MCP resource pattern"
+    ]
+}
+_SAMPLE_METADATA: dict[str, Any] = {
+    "version": "1.0.0",
+    "source": "Newsroom MCP Server",
+    "read_only": True
+}
 
-def get_sample_data() -> Dict[str, Any]:
+# Last formatted timestamp, keyed by whole epoch second
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with second precision.
+    
+    The formatted value is reused for every call within the same second, so
+    bursts of requests only pay for one strftime.
+    
+    Returns:
+        str: Timestamp such as "2024-01-15T10:30:00Z".
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    second, formatted = _timestamp_cache
+    if second != now:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
+def get_sample_data() -> dict[str, Any]:
     """Sample data resource that returns static JSON data.
     
     This resource demonstrates the basic pattern for exposing data through MCP.
     It returns a static JSON object with sample information including a message,
-    timestamp, and nested data structure.
+    timestamp, and nested data structure. Only the timestamp is computed per
+    call; the nested data and metadata are shared and must not be mutated.
     
     Returns:
-        Dict[str, Any]: Static JSON object with sample information.
+        dict[str, Any]: Static JSON object with sample information.
         
     Example:
         When accessed via URI "sample://data", returns:
@@ -31,23 +71,10 @@ def get_sample_data() -> Dict[str, Any]:
         }
     """
     return {
-        "message": "This is sample data from an MCP resource",
-        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "data": {
-            "id": 1,
-            "name": "Sample Resource",
-            "type": "demonstration",
-            "features": [
-                "Static data exposure",
-                "JSON serialization",
-                "MCP resource pattern"
-            ]
-        },
-        "metadata": {
-            "version": "1.0.0",
-            "source": "Newsroom MCP Server",
-            "read_only": True
-        }
+        "message": _SAMPLE_MESSAGE,
+        "timestamp": _utc_timestamp(),
+        "data": _SAMPLE_DATA,
+        "metadata": _SAMPLE_METADATA
     }
 
 
@@ -67,7 +94,7 @@ def register_resources(mcp):
             "idempotentHint": True
         }
     )
-    def sample_data_resource() -> Dict[str, Any]:
+    def sample_data_resource() -> dict[str, Any]:
         """Provides sample data as a read-only MCP resource."""
         return get_sample_data()
 
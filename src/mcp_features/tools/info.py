@@ -4,29 +4,34 @@ This module provides a tool that returns metadata about the MCP server
 and its capabilities.
 """
 
-from typing import Dict, Any
+from typing import Any
 
+# Server metadata is fully static, so it is built once at import time
+_SERVER_INFO: dict[str, Any] = {
+    "name": "Newsroom MCP",
+    "version": "1.0.0",
+    "authentication": "Azure OAuth (Microsoft Entra ID)",
+    "features": {
+        "resources": ["sample_data"],
+        "tools": ["echo", "server_info"],
+        "prompts": ["greeting_template"]
+    },
+    "transport": "HTTP",
+    "protocol": "MCP (Model Context Protocol)",
+    "framework": "FastMCP"
+}
 
-def get_server_info() -> Dict[str, Any]:
+
+def get_server_info() -> dict[str, Any]:
     """Get server information and capabilities.
     
+    The same dictionary is returned on every call and must not be mutated.
+    
     Returns:
-        Dict[str, Any]: Server metadata including name, version, authentication,
+        dict[str, Any]: Server metadata including name, version, authentication,
                        and available features.
     """
-    return {
-        "name": "Newsroom MCP",
-        "version": "1.0.0",
-        "authentication": "Azure OAuth (Microsoft Entra ID)",
-        "features": {
-            "resources": ["sample_data"],
-            "tools": ["echo", "server_info"],
-            "prompts": ["greeting_template"]
-        },
-        "transport": "HTTP",
-        "protocol": "MCP (Model Context Protocol)",
-        "framework": "FastMCP"
-    }
+    return _SERVER_INFO
 
 
 def register_tools(mcp):
@@ -43,7 +48,7 @@ def register_tools(mcp):
             "idempotentHint": True
         }
     )
-    def server_info() -> Dict[str, Any]:
+    def server_info() -> dict[str, Any]:
         """Get information about the MCP server.
         
         This tool provides metadata about the server including its name,
@@ -51,7 +56,7 @@ def register_tools(mcp):
         tools, and prompts).
         
         Returns:
-            Dict[str, Any]: Server information object containing:
+            dict[str, Any]: Server information object containing:
                 - name: Server name
                 - version: Server version
                 - authentication: Authentication method used
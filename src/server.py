@@ -4,51 +4,113 @@ This module implements the main MCP server with Azure OAuth authentication,
 integrating all MCP features (resources, tools, and prompts).
 """
 
+import asyncio
+import importlib
 import logging
-from fastmcp import FastMCP
-
-from src.config import get_config
-from src.auth import PatchedAzureProvider
-from src.mcp_features.resources.sample import register_resources
-from src.mcp_features.tools.echo import register_tools as register_echo_tools
-from src.mcp_features.tools.info import register_tools as register_info_tools
-from src.mcp_features.prompts.greeting import register_prompts
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for more verbose output
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional
+
+from src.config import Config, get_config
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
-# Also set FastMCP and auth loggers to DEBUG
-logging.getLogger('fastmcp').setLevel(logging.DEBUG)
-logging.getLogger('fastmcp.server.auth').setLevel(logging.DEBUG)
+# Separator line for the startup banner
+_SEP = "=" * 60
+
+# Startup banner, emitted as a single log record; filled in lazily by logging
+_BANNER = "\n".join([
+    _SEP,
+    "🚀 %s v%s ready!",
+    "   Authentication: Azure OAuth (Microsoft Entra ID)",
+    "   Server will run on: %s:%s",
+    "   OAuth Redirect URI: %s",
+    _SEP,
+])
 
+# MCP features as (module path, register function, what it registers).
+# Modules are imported only when create_server() registers them, so adding a
+# feature means adding an entry here.
+FEATURES = [
+    ("src.mcp_features.resources.sample", "register_resources", "Resources: sample_data"),
+    ("src.mcp_features.tools.echo", "register_tools", "Tools: echo"),
+    ("src.mcp_features.tools.info", "register_tools", "Tools: server_info"),
+    ("src.mcp_features.prompts.greeting", "register_prompts", "Prompts: greeting_template"),
+]
 
-def create_server() -> FastMCP:
+
+def configure_logging(level: Optional[str] = None, force: bool = True) -> None:
+    """Configure process-wide logging for the server.
+    
+    Only entry points (run.py, app_factory() and this module's __main__ block)
+    call this, so importing the server never installs handlers in host
+    applications or tests. Entry points call it once before loading the
+    configuration, so messages logged while loading it are shown, and again
+    afterwards to apply the level read from the .env file.
+    
+    Args:
+        level: Log level name (e.g. "DEBUG"). Defaults to the MCP_LOG_LEVEL
+            environment variable, or INFO if it is unset or invalid.
+        force: Replace any handlers already installed on the root logger.
+            Entry points that own the process pass True; app_factory() passes
+            False so the host ASGI server's logging setup is left in place.
+    """
+    if level is None:
+        level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
+        if not isinstance(logging.getLevelName(level), int):
+            level = "INFO"
+    
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=force
+    )
+    
+    # Set the server, FastMCP and auth loggers directly, so the level applies
+    # even when basicConfig() left an existing root configuration untouched
+    logging.getLogger('src').setLevel(level)
+    logging.getLogger('fastmcp').setLevel(level)
+    logging.getLogger('fastmcp.server.auth').setLevel(level)
+
+
+def create_server(config: Optional[Config] = None) -> "FastMCP":
     """Create and configure the FastMCP server with Azure OAuth authentication.
     
     This function:
-    1. Loads configuration from environment variables
+    1. Loads configuration from environment variables (unless one is given)
     2. Sets up Azure OAuth authentication provider
     3. Initializes the FastMCP server
     4. Registers all MCP features (resources, tools, prompts)
     
+    Args:
+        config: Configuration to build the server from. Defaults to the
+            global configuration from get_config().
+    
     Returns:
         FastMCP: Configured FastMCP server instance ready to run.
         
     Raises:
         ValueError: If required configuration is missing or invalid.
     """
+    # FastMCP and the auth provider pull in the whole FastMCP stack (pydantic,
+    # httpx, starlette, JWT libraries), so they are imported here rather than
+    # at module level to keep `import src.server` cheap.
+    from fastmcp import FastMCP
+
+    from src.auth import PatchedAzureProvider
+
     logger.info("Starting Newsroom MCP server initialization...")
     
     # Load configuration
     try:
-        config = get_config()
-        logger.info(f"Configuration loaded successfully for {config.server.name} v{config.server.version}")
+        if config is None:
+            config = get_config()
+        logger.info("Configuration loaded successfully for %s v%s", config.server.name, config.server.version)
     except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
+        logger.error("Failed to load configuration: %s", e)
         raise
     
     # Configure Azure OAuth authentication using PatchedAzureProvider
@@ -63,11 +125,12 @@ def create_server() -> FastMCP:
             redirect_path=config.azure_oauth.redirect_path,
             required_scopes=config.azure_oauth.required_scopes,
             timeout_seconds=config.azure_oauth.timeout_seconds,
+            token_cache_ttl_seconds=config.azure_oauth.token_cache_ttl_seconds,
         )
-        logger.info(f"Azure OAuth provider (patched for v2.0) configured with tenant: {config.azure_oauth.tenant_id}")
-        logger.info(f"Redirect URI: {config.azure_oauth.redirect_uri}")
+        logger.info("Azure OAuth provider (patched for v2.0) configured with tenant: %s", config.azure_oauth.tenant_id)
+        logger.info("Redirect URI: %s", config.azure_oauth.redirect_uri)
     except Exception as e:
-        logger.error(f"Failed to configure Azure OAuth provider: {e}")
+        logger.error("Failed to configure Azure OAuth provider: %s", e)
         raise
     
     # Initialize FastMCP server with authentication
@@ -75,53 +138,143 @@ def create_server() -> FastMCP:
         name=config.server.name,
         auth=auth_provider
     )
-    logger.info(f"FastMCP server '{config.server.name}' initialized with Azure OAuth authentication")
+    logger.info("FastMCP server '%s' initialized with Azure OAuth authentication", config.server.name)
     
     # Register MCP features
     try:
-        # Register resources
-        register_resources(mcp)
-        logger.info("✓ Resources registered: sample_data")
-        
-        # Register tools
-        register_echo_tools(mcp)
-        register_info_tools(mcp)
-        logger.info("✓ Tools registered: echo, server_info")
-        
-        # Register prompts
-        register_prompts(mcp)
-        logger.info("✓ Prompts registered: greeting_template")
-        
+        _register_features(mcp)
     except Exception as e:
-        logger.error(f"Failed to register MCP features: {e}")
+        logger.error("Failed to register MCP features: %s", e)
         raise
     
-    logger.info("=" * 60)
-    logger.info(f"🚀 {config.server.name} v{config.server.version} ready!")
-    logger.info(f"   Authentication: Azure OAuth (Microsoft Entra ID)")
-    logger.info(f"   Server will run on: {config.server.host}:{config.server.port}")
-    logger.info(f"   OAuth Redirect URI: {config.azure_oauth.redirect_uri}")
-    logger.info("=" * 60)
+    logger.info(
+        _BANNER,
+        config.server.name,
+        config.server.version,
+        config.server.host,
+        config.server.port,
+        config.azure_oauth.redirect_uri,
+    )
     
     return mcp
 
 
-# Create the server instance
-mcp = create_server()
+def _register_features(mcp: "FastMCP") -> None:
+    """Import each module in FEATURES and register its features with the server.
+    
+    Args:
+        mcp: FastMCP server instance to register features with.
+    """
+    for module_path, func_name, description in FEATURES:
+        register = getattr(importlib.import_module(module_path), func_name)
+        register(mcp)
+        logger.info("✓ Registered %s", description)
+
+
+# Global server instance (lazy-loaded)
+_mcp: Optional["FastMCP"] = None
+
+
+def get_mcp(config: Optional[Config] = None) -> "FastMCP":
+    """Get the global server instance.
+    
+    The server is created on first access and cached for subsequent calls,
+    so importing this module does not read configuration, build the OAuth
+    provider or register any MCP features.
+    
+    Args:
+        config: Configuration to build the server from on first access, so
+            entry points that already loaded it can pass it through. Ignored
+            once the server exists. Defaults to get_config().
+    
+    Returns:
+        FastMCP: The configured server instance.
+        
+    Raises:
+        ValueError: If required configuration is missing or invalid.
+    """
+    global _mcp
+    if _mcp is None:
+        _mcp = create_server(config)
+    return _mcp
+
+
+async def close_server(mcp: "FastMCP") -> None:
+    """Release resources held by the server, such as pooled auth connections.
+    
+    Args:
+        mcp: FastMCP server instance that is shutting down.
+    """
+    close = getattr(mcp.auth, "aclose", None)
+    if close is not None:
+        await close()
+
+
+async def run_http(mcp: "FastMCP", host: str, port: int) -> None:
+    """Serve over HTTP until shutdown, then close the server's resources.
+    
+    Args:
+        mcp: FastMCP server instance to run.
+        host: Host to bind to.
+        port: Port to bind to.
+    """
+    try:
+        await mcp.run_async(transport="http", host=host, port=port)
+    finally:
+        await close_server(mcp)
+
+
+def app_factory():
+    """Build the ASGI application for running under an ASGI server.
+    
+    Usage:
+        uvicorn src.server:app_factory --factory --host localhost --port 8000
+    
+    Returns:
+        The Starlette application serving the MCP HTTP transport.
+    """
+    # Runs inside the host server's process, so keep its logging handlers
+    configure_logging(force=False)
+    config = get_config()
+    configure_logging(config.server.log_level, force=False)
+    mcp = get_mcp(config)
+    
+    app = mcp.http_app()
+    app_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        try:
+            async with app_lifespan(app) as state:
+                yield state
+        finally:
+            await close_server(mcp)
+    
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def __getattr__(name: str):
+    """Keep `src.server.mcp` working for callers such as `fastmcp run`."""
+    if name == "mcp":
+        return get_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     """Run the server when executed directly."""
+    # Install log handlers first so configuration loading messages are shown
+    configure_logging()
+    
     # Load configuration for runtime settings
     config = get_config()
+    configure_logging(config.server.log_level)
+    
+    mcp = get_mcp(config)
     
-    logger.info(f"Starting HTTP server on {config.server.host}:{config.server.port}...")
+    logger.info("Starting HTTP server on %s:%s...", config.server.host, config.server.port)
     logger.info("Press Ctrl+C to stop the server")
     
     # Run the server with HTTP transport (required for OAuth)
-    mcp.run(
-        transport="http",
-        host=config.server.host,
-        port=config.server.port
-    )
+    asyncio.run(run_http(mcp, config.server.host, config.server.port))
 
@@ -28,9 +28,16 @@ async def test_server():
             print("✅ Successfully authenticated!")
             print()
             
+            # The three list calls are independent, so issue them concurrently
+            # over the same session
+            resources, tools, prompts = await asyncio.gather(
+                client.list_resources(),
+                client.list_tools(),
+                client.list_prompts(),
+            )
+            
             # Test 1: List available resources
             print("📦 Testing Resources...")
-            resources = await client.list_resources()
             print(f"   Found {len(resources)} resource(s):")
             for resource in resources:
                 print(f"   - {resource.name}: {resource.description}")
@@ -44,7 +51,6 @@ async def test_server():
             
             # Test 3: List available tools
             print("🔧 Testing Tools...")
-            tools = await client.list_tools()
             print(f"   Found {len(tools)} tool(s):")
             for tool in tools:
                 print(f"   - {tool.name}: {tool.description}")
@@ -68,7 +74,6 @@ async def test_server():
             
             # Test 6: List available prompts
             print("💬 Testing Prompts...")
-            prompts = await client.list_prompts()
             print(f"   Found {len(prompts)} prompt(s):")
             for prompt in prompts:
                 print(f"   - {prompt.name}: {prompt.description}")
@@ -106,7 +111,20 @@ if __name__ == "__main__":
         cache_dir = os.path.expanduser("~/.fastmcp/oauth-mcp-client-cache")
         if os.path.exists(cache_dir):
             print(f"🗑️  Clearing OAuth cache: {cache_dir}")
-            shutil.rmtree(cache_dir)
+            if os.name == "nt":
+                shutil.rmtree(cache_dir)
+            else:
+                import threading
+                import uuid
+                # Move the cache aside in one rename, then delete it in the
+                # background while the tests run (the thread is joined at exit)
+                tombstone = f"{cache_dir}.dead.{uuid.uuid4().hex}"
+                os.rename(cache_dir, tombstone)
+                threading.Thread(
+                    target=shutil.rmtree,
+                    args=(tombstone,),
+                    kwargs={"ignore_errors": True},
+                ).start()
             print("✅ Cache cleared! You will be prompted to authenticate again.")
             print()
 
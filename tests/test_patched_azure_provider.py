@@ -0,0 +1,114 @@
+"""Tests for the pooled, caching Azure token verifier."""
+
+import asyncio
+import base64
+import json
+import time
+
+import httpx
+import pytest
+
+from src.auth import patched_azure_provider
+from src.auth.patched_azure_provider import PooledAzureTokenVerifier
+
+
+def make_jwt(exp: float) -> str:
+    """Build an unsigned JWT-shaped token with the given 'exp' claim."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class FakeGraph:
+    """Mock Microsoft Graph /me endpoint that counts calls per token."""
+    
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.calls = []
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.headers["Authorization"].removeprefix("Bearer "))
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, text="InvalidAuthenticationToken")
+        return httpx.Response(200, json={"id": "user-id", "mail": "user@example.com"})
+
+
+@pytest.fixture
+def graph():
+    return FakeGraph()
+
+
+@pytest.fixture
+async def verifier(graph):
+    verifier = PooledAzureTokenVerifier(required_scopes=["User.Read"])
+    verifier._client = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+    verifier._client_loop = asyncio.get_running_loop()
+    yield verifier
+    await verifier.aclose()
+
+
+async def test_cache_hit_skips_graph(verifier, graph):
+    first = await verifier.verify_token("opaque-token")
+    second = await verifier.verify_token("opaque-token")
+    
+    assert first is not None
+    assert second is first
+    assert graph.calls == ["opaque-token"]
+
+
+async def test_expired_token_is_not_cached(verifier, graph):
+    token = make_jwt(time.time() - 60)
+    
+    assert await verifier.verify_token(token) is not None
+    assert await verifier.verify_token(token) is not None
+    
+    assert graph.calls == [token, token]
+    assert token not in verifier._token_cache
+
+
+async def test_failure_is_not_cached(verifier, graph):
+    graph.status_code = 401
+    
+    assert await verifier.verify_token("bad-token") is None
+    assert await verifier.verify_token("bad-token") is None
+    
+    assert graph.calls == ["bad-token", "bad-token"]
+    assert verifier._token_cache == {}
+
+
+async def test_non_jwt_token_uses_default_ttl(verifier):
+    await verifier.verify_token("opaque-token")
+    
+    deadline, _ = verifier._token_cache["opaque-token"]
+    remaining = deadline - time.monotonic()
+    assert verifier.token_cache_ttl_seconds == patched_azure_provider.DEFAULT_TOKEN_CACHE_TTL_SECONDS
+    assert verifier.token_cache_ttl_seconds - 5 < remaining <= verifier.token_cache_ttl_seconds
+
+
+async def test_zero_ttl_disables_cache(verifier, graph):
+    verifier.token_cache_ttl_seconds = 0
+    
+    assert await verifier.verify_token("opaque-token") is not None
+    assert await verifier.verify_token("opaque-token") is not None
+    
+    assert graph.calls == ["opaque-token", "opaque-token"]
+    assert verifier._token_cache == {}
+
+
+async def test_ttl_is_clamped_to_token_expiry(verifier):
+    token = make_jwt(time.time() + 60)
+    await verifier.verify_token(token)
+    
+    deadline, _ = verifier._token_cache[token]
+    assert 55 < deadline - time.monotonic() <= 60
+
+
+async def test_oldest_entry_is_evicted_at_max_size(verifier, graph, monkeypatch):
+    monkeypatch.setattr(patched_azure_provider, "TOKEN_CACHE_MAX_SIZE", 2)
+    
+    for token in ("token-1", "token-2", "token-3"):
+        await verifier.verify_token(token)
+    
+    assert list(verifier._token_cache) == ["token-2", "token-3"]
+    
+    await verifier.verify_token("token-1")
+    assert graph.calls == ["token-1", "token-2", "token-3", "token-1"]